@@ -5,6 +5,7 @@ Occupation-Industry Mapper
 Maps occupation-level AI impacts to industry-level aggregated impacts using
 employment-weighted averages across detailed occupational data.
 """
+import functools
 import json
 import logging
 import os
@@ -20,6 +21,49 @@ from processing.process_anthropic_occupation_data import AnthropicOccupationProc
 
 logger = logging.getLogger(__name__)
 
+# ijson streams the BLS employment file so only the employment matrix is built
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Share of an occupation's employment counted as covered, and weight of its
+# confidence in the industry average, by impact data source. SOC-group
+# estimates get partial credit
+_COVERAGE_CREDIT = {'anthropic_direct': 1.0, 'soc_default': 0.3}
+_CONFIDENCE_CREDIT = {'anthropic_direct': 1.0, 'soc_default': 0.5}
+
+
+def _parse_bls_file(path: str) -> Dict[str, Any]:
+    """
+    Read the industry x occupation employment matrix from a BLS file. Accepts
+    both the collector's {"employment_matrix": ..., "metadata": ...} output and
+    a bare matrix.
+    """
+    if not IJSON_AVAILABLE:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return data.get("employment_matrix", data)
+    
+    # Stream top-level entries: the matrix is built, collection metadata is
+    # parsed one entry at a time and dropped
+    matrix = {}
+    with open(path, 'rb') as f:
+        for key, value in ijson.kvitems(f, '', use_float=True):
+            if key == "employment_matrix":
+                return value
+            if key != "metadata":
+                matrix[key] = value
+    return matrix
+
+
+@functools.lru_cache(maxsize=4)
+def _load_bls_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a BLS employment file, memoized per path and modification time."""
+    return _parse_bls_file(path)
+
+
 class OccupationIndustryMapper:
     """
     Maps occupation-level AI impacts to industry-level aggregated impacts
@@ -131,17 +175,7 @@ class OccupationIndustryMapper:
         """Load BLS occupation employment data."""
         # Auto-discover BLS file if not specified
         if not bls_file:
-            possible_files = [
-                "bls_occupation_employment.json",
-                "bls_occupation_employment_latest.json",
-                "occupation_employment_matrix.json"
-            ]
-            
-            for filename in possible_files:
-                filepath = os.path.join(self.input_dir, filename)
-                if os.path.exists(filepath):
-                    bls_file = filepath
-                    break
+            bls_file = self._discover_bls_file()
         
         if not bls_file or not os.path.exists(bls_file):
             logger.warning("No BLS occupation employment data found - will use estimated employment shares")
@@ -149,8 +183,10 @@ class OccupationIndustryMapper:
             return self._create_estimated_employment_data()
         
         try:
-            with open(bls_file, 'r') as f:
-                self.occupation_employment = json.load(f)
+            # Re-parsed only when the file changes; the cached dict is shared, so
+            # take a shallow copy for this mapper
+            parsed = _load_bls_file(bls_file, os.stat(bls_file).st_mtime_ns)
+            self.occupation_employment = dict(parsed)
             
             logger.info(f"Loaded BLS occupation employment data from {bls_file}")
             logger.info(f"Industries covered: {list(self.occupation_employment.keys())}")
@@ -168,6 +204,21 @@ class OccupationIndustryMapper:
             self.mapping_metadata["data_sources"]["bls_employment"] = f"error: {str(e)}"
             return self._create_estimated_employment_data()
 
+    def _discover_bls_file(self) -> Optional[str]:
+        """Find the first known BLS employment file in the input directory."""
+        possible_files = [
+            "bls_occupation_employment.json",
+            "bls_occupation_employment_latest.json",
+            "occupation_employment_matrix.json"
+        ]
+        
+        for filename in possible_files:
+            filepath = os.path.join(self.input_dir, filename)
+            if os.path.exists(filepath):
+                return filepath
+        
+        return None
+
     def _create_estimated_employment_data(self) -> bool:
         """Create estimated employment data based on typical industry compositions."""
         logger.info("Creating estimated employment shares based on typical industry compositions...")
@@ -260,9 +311,47 @@ class OccupationIndustryMapper:
         
         self.industry_rates = {}
         
-        for industry, occupations in self.occupation_employment.items():
-            industry_result = self._calculate_single_industry_rates(industry, occupations)
-            self.industry_rates[industry] = industry_result
+        matrices = self._build_matrices()
+        employment = matrices["employment"]
+        
+        # Employment-weighted sums for every industry at once
+        weighted_automation = employment @ matrices["automation"]
+        weighted_augmentation = employment @ matrices["augmentation"]
+        # Employment per data source; credit is applied to the shares so an
+        # industry covered by a single source gets exactly that source's credit
+        source_employment = employment @ matrices["source_masks"]
+        
+        # Confidence is averaged per occupation present, not per worker, so it
+        # is summed over the (industry, occupation) pairs rather than a matrix
+        rows, cols = matrices["rows"], matrices["cols"]
+        industry_count = len(matrices["industries"])
+        confidence_credit = matrices["confidence_credit"][cols]
+        confidence_sum = np.bincount(rows, weights=matrices["confidence"][cols] * confidence_credit,
+                                     minlength=industry_count)
+        confidence_count = np.bincount(rows, weights=confidence_credit, minlength=industry_count)
+        
+        for i, industry in enumerate(matrices["industries"]):
+            total_employment = matrices["total_employment"][i]
+            
+            if total_employment == 0:
+                logger.warning(f"No employment data for industry: {industry}")
+                self.industry_rates[industry] = self._create_fallback_industry_rates(industry)
+                continue
+            
+            data_coverage = float((source_employment[i] / total_employment) @ matrices["coverage_credit"])
+            avg_confidence = float(confidence_sum[i] / confidence_count[i]) if confidence_count[i] > 0 else 0.5
+            overall_confidence = self._calculate_industry_confidence(data_coverage, avg_confidence, industry)
+            
+            self.industry_rates[industry] = {
+                'automation_rate': float(weighted_automation[i] / total_employment),
+                'augmentation_rate': float(weighted_augmentation[i] / total_employment),
+                'data_coverage': data_coverage,
+                'total_employment': total_employment,
+                'confidence': overall_confidence,
+                'avg_data_confidence': avg_confidence,
+                'occupations_analyzed': len(self.occupation_employment[industry]),
+                'calculation_method': 'occupation_weighted'
+            }
         
         # Calculate coverage statistics
         self._calculate_coverage_statistics()
@@ -272,57 +361,50 @@ class OccupationIndustryMapper:
         
         return self.industry_rates
 
-    def _calculate_single_industry_rates(self, industry: str, occupations: Dict) -> Dict[str, Any]:
-        """Calculate automation rates for a single industry."""
-        total_employment = sum(occ.get('employment', 0) for occ in occupations.values())
-        
-        if total_employment == 0:
-            logger.warning(f"No employment data for industry: {industry}")
-            return self._create_fallback_industry_rates(industry)
-        
-        weighted_automation = 0
-        weighted_augmentation = 0
-        coverage_employment = 0  # Employment covered by Anthropic data
-        confidence_sum = 0
-        confidence_count = 0
-        
-        # Process each occupation in the industry
-        for soc_code, occ_data in occupations.items():
-            employment = occ_data.get('employment', 0)
-            employment_share = employment / total_employment
-            
-            # Get AI impact data for this occupation
-            impact_data = self._get_occupation_impact_data(soc_code, occ_data)
-            
-            # Apply to weighted calculation
-            weighted_automation += impact_data['automation_rate'] * employment_share
-            weighted_augmentation += impact_data['augmentation_rate'] * employment_share
-            
-            # Track coverage and confidence
-            if impact_data['source'] == 'anthropic_direct':
-                coverage_employment += employment
-                confidence_sum += impact_data['confidence']
-                confidence_count += 1
-            elif impact_data['source'] == 'soc_default':
-                # Partial credit for SOC-based estimates
-                coverage_employment += employment * 0.3
-                confidence_sum += impact_data['confidence'] * 0.5
-                confidence_count += 0.5
-        
-        # Calculate metrics
-        data_coverage = coverage_employment / total_employment if total_employment > 0 else 0
-        avg_confidence = confidence_sum / confidence_count if confidence_count > 0 else 0.5
-        overall_confidence = self._calculate_industry_confidence(data_coverage, avg_confidence, industry)
+    def _build_matrices(self) -> Dict[str, Any]:
+        """
+        Lay out employment as an (industries x occupations) matrix alongside
+        per-occupation impact vectors, resolving each distinct SOC code once.
+        """
+        industries = list(self.occupation_employment)
+        soc_index = {}
+        impacts = []
+        rows, cols, values = [], [], []
+        total_employment = []
+        
+        for i, occupations in enumerate(self.occupation_employment.values()):
+            start = len(values)
+            for soc_code, occ_data in occupations.items():
+                j = soc_index.get(soc_code)
+                if j is None:
+                    j = soc_index[soc_code] = len(impacts)
+                    impacts.append(self._get_occupation_impact_data(soc_code, occ_data))
+                rows.append(i)
+                cols.append(j)
+                values.append(occ_data.get('employment', 0))
+            total_employment.append(sum(values[start:]))
+        
+        rows = np.array(rows, dtype=np.intp)
+        cols = np.array(cols, dtype=np.intp)
+        employment = np.zeros((len(industries), len(impacts)))
+        employment[rows, cols] = values
+        
+        def impact_vector(items):
+            return np.fromiter(items, dtype=np.float64, count=len(impacts))
         
         return {
-            'automation_rate': weighted_automation,
-            'augmentation_rate': weighted_augmentation,
-            'data_coverage': data_coverage,
-            'total_employment': total_employment,
-            'confidence': overall_confidence,
-            'avg_data_confidence': avg_confidence,
-            'occupations_analyzed': len(occupations),
-            'calculation_method': 'occupation_weighted'
+            "industries": industries,
+            "total_employment": total_employment,
+            "employment": employment,
+            "rows": rows,
+            "cols": cols,
+            "automation": impact_vector(impact['automation_rate'] for impact in impacts),
+            "augmentation": impact_vector(impact['augmentation_rate'] for impact in impacts),
+            "confidence": impact_vector(impact['confidence'] for impact in impacts),
+            "source_masks": np.array([[impact['source'] == source for source in _COVERAGE_CREDIT]
+                                      for impact in impacts], dtype=np.float64).reshape(len(impacts), len(_COVERAGE_CREDIT)),
+            "coverage_credit": np.array(list(_COVERAGE_CREDIT.values())),
+            "confidence_credit": impact_vector(_CONFIDENCE_CREDIT.get(impact['source'], 0.0) for impact in impacts)
         }
 
     def _get_occupation_impact_data(self, soc_code: str, occ_data: Dict) -> Dict[str, Any]:
@@ -9,6 +9,7 @@ import logging
 import os
 import sys
 import re
+import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -62,6 +63,9 @@ class AnthropicOccupationProcessor:
         for occupation in occupations_data:
             self._process_single_occupation(occupation)
         
+        # Rates outside [0, 1] (e.g. percentages above 100) are clamped
+        self._clamp_rates(self.processed_occupations)
+        
         # Generate summary statistics
         summary_stats = self._calculate_summary_statistics()
         
@@ -208,6 +212,21 @@ class AnthropicOccupationProcessor:
         
         self.processing_stats["successfully_mapped"] += 1
 
+    def _clamp_rates(self, occupations: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Clamp automation/augmentation rates to [0, 1] in place, one array pass
+        per field; only out-of-range records are written back.
+        """
+        records = list(occupations.values())
+        
+        for field in ("automation_rate", "augmentation_rate"):
+            rates = np.fromiter((record[field] for record in records), dtype=np.float64, count=len(records))
+            clipped = np.clip(rates, 0.0, 1.0)
+            for i in np.flatnonzero(clipped != rates):
+                records[i][field] = float(clipped[i])
+        
+        return occupations
+
     def _extract_rate(self, occupation: Dict, possible_keys: List[str]) -> Optional[float]:
         """
         Extract rate value trying multiple possible key names.
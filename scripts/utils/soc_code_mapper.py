@@ -6,10 +6,40 @@ Handles Standard Occupational Classification (SOC) code normalization and O*NET
 """
 import re
 import logging
+import functools
 from typing import Optional, Dict, List
 
 logger = logging.getLogger(__name__)
 
+# Accepted SOC code formats, compiled once: XX-XXXX (standard), XX-XXXX.XX (O*NET
+# decimal suffix), XXXXXX (6 digits), XX.XXXX (dot separator), XX XXXX (space separator)
+_SOC_RE = re.compile(r'^(\d{2})(?:-(\d{4})(?:\.\d{2})?|(?:\.|\s+)?(\d{4}))$')
+
+
+def _is_canonical_soc(code: str) -> bool:
+    """Check for the standardized XX-XXXX shape with plain character tests."""
+    # isdecimal() accepts exactly the characters regex \d does
+    return len(code) == 7 and code[2] == '-' and code[:2].isdecimal() and code[3:].isdecimal()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_soc_code(cleaned: str) -> Optional[str]:
+    """
+    Reduce any accepted SOC format to XX-XXXX without checking the major group.
+    Memoized: pipelines see the same few hundred codes on every BLS row.
+    """
+    # Already standardized
+    if _is_canonical_soc(cleaned):
+        return cleaned
+    
+    # Otherwise match any accepted format in one pass
+    match = _SOC_RE.match(cleaned)
+    if not match:
+        return None
+    major, dashed_detail, detail = match.groups()
+    return f"{major}-{dashed_detail or detail}"
+
+
 class SOCCodeMapper:
     """
     Utility class for handling SOC code standardization and O*NET mappings.
@@ -42,20 +72,6 @@ class SOCCodeMapper:
             "53": "Transportation and Material Moving Occupations",
             "55": "Military Specific Occupations"
         }
-        
-        # Common SOC code patterns and their standardized formats
-        self.soc_patterns = [
-            # Pattern: XX-XXXX (standard format)
-            (r'^(\d{2})-(\d{4})$', r'\1-\2'),
-            # Pattern: XX-XXXX.XX (with decimal)
-            (r'^(\d{2})-(\d{4})\.\d{2}$', r'\1-\2'),
-            # Pattern: XXXXXX (6 digits)
-            (r'^(\d{2})(\d{4})$', r'\1-\2'),
-            # Pattern: XX.XXXX (dot separator)
-            (r'^(\d{2})\.(\d{4})$', r'\1-\2'),
-            # Pattern: XX XXXX (space separator)
-            (r'^(\d{2})\s+(\d{4})$', r'\1-\2'),
-        ]
 
     def standardize_soc_code(self, soc_code: str) -> Optional[str]:
         """
@@ -74,14 +90,10 @@ class SOCCodeMapper:
         # Clean input: remove extra whitespace
         cleaned = str(soc_code).strip()
         
-        # Try each pattern
-        for pattern, replacement in self.soc_patterns:
-            match = re.match(pattern, cleaned)
-            if match:
-                standardized = re.sub(pattern, replacement, cleaned)
-                # Validate the result
-                if self._validate_soc_code(standardized):
-                    return standardized
+        # Parse the format (cached), then check the major group
+        standardized = _parse_soc_code(cleaned)
+        if standardized and standardized[:2] in self.soc_major_groups:
+            return standardized
         
         logger.warning(f"Could not standardize SOC code: {soc_code}")
         return None
@@ -96,11 +108,8 @@ class SOCCodeMapper:
         Returns:
             True if valid, False otherwise
         """
-        if not soc_code or len(soc_code) != 7:
-            return False
-        
         # Check format: XX-XXXX
-        if not re.match(r'^\d{2}-\d{4}$', soc_code):
+        if not soc_code or not _is_canonical_soc(soc_code):
             return False
         
         # Check if major group exists
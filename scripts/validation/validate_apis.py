@@ -1,178 +1,353 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import io
 import json
 import os
+import sys
+import re
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def test_arxiv_api():
+# orjson parses the raw response bytes directly; fall back to the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Response schemas compile into straight-line validators when fastjsonschema is
+# installed; without it responses are not schema-checked
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+    _SchemaError = fastjsonschema.JsonSchemaException
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+    _SchemaError = ValueError
+
+# Only advertise brotli when urllib3 can decode it (requires the brotli package)
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+HEADERS = {
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "User-Agent": "ai-labor-index-validator/1.0"
+}
+
+# Shared session so every probe sends the same headers and reuses connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
+# Transient failures (rate limits, gateway errors) are retried with exponential
+# backoff; retries only fire on failure, so the happy path pays nothing extra.
+# Connect errors and timeouts are not retried, and HEAD is never retried, so the
+# _alive preflight still fails fast on an unreachable host
+_RETRY = Retry(
+    total=3,
+    connect=0,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True
+)
+
+# One pool per host, sized so concurrent probes share keep-alive TLS connections
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+AI_KEYWORDS = ("ai", "artificial intelligence", "machine learning", "ml", "deep learning")
+
+# Single alternation so each job's text is scanned once for every AI keyword
+AI_RE = re.compile(r"\b(" + "|".join(map(re.escape, AI_KEYWORDS)) + r")\b", re.IGNORECASE)
+
+def _is_ai_job(job):
+    """Check a job's title, then its description, for AI keywords"""
+    return (AI_RE.search(job.get("title", "")) is not None
+            or AI_RE.search(job.get("description", "")) is not None)
+
+# Serializes console output from probes running in worker threads
+_print_lock = threading.Lock()
+
+def _run_buffered(probe, buf, *args):
+    """Run a probe, then append its output to buf as one uninterrupted block"""
+    out = []
+    try:
+        return probe(*args, log=out.append)
+    finally:
+        with _print_lock:
+            buf.write("\n".join(out) + "\n")
+
+def _result(ok, response=None, error=None, skipped=False):
+    """Build the structured result a probe reports for the summary and --json output"""
+    result = {"ok": ok}
+    if response is not None:
+        result["status"] = response.status_code
+        result["bytes"] = len(response.content)
+    if error:
+        result["error"] = error
+    if skipped:
+        result["skipped"] = True
+    return result
+
+# Summary labels in report order, keyed by probe name
+_SUMMARY_LABELS = {
+    "arxiv": "ArXiv API",
+    "bls": "BLS API",
+    "remote_jobs": "Remote Jobs API",
+    "news": "News API"
+}
+
+def _human_summary(results, buf):
+    """Append the human-readable test summary to buf"""
+    def status(result):
+        if result["ok"]:
+            return "✅ SUCCESS"
+        return "❌ SKIPPED" if result.get("skipped") else "❌ FAILED"
+    
+    working_apis = sum(result["ok"] for result in results.values())
+    total_apis = len(results)
+    
+    buf.write("\n===== TEST SUMMARY =====\n")
+    buf.write("\n".join(f"{label}: {status(results[name])}" for name, label in _SUMMARY_LABELS.items()))
+    buf.write(f"\n\n{working_apis}/{total_apis} APIs are working correctly\n")
+    
+    if working_apis == 0:
+        buf.write("\n❌ CRITICAL: All APIs are failing. Check your internet connection.\n")
+    elif working_apis < total_apis:
+        buf.write("\n⚠️ WARNING: Some APIs are failing. Review the output above for details.\n")
+    else:
+        buf.write("\n✅ SUCCESS: All APIs are working correctly.\n")
+
+def _compile_schema(schema):
+    """Compile a response schema, or return a pass-through when fastjsonschema is missing"""
+    if FASTJSONSCHEMA_AVAILABLE:
+        return fastjsonschema.compile(schema)
+    return lambda data: data
+
+_BLS_V = _compile_schema({
+    "type": "object",
+    "required": ["status", "Results"],
+    "properties": {
+        "status": {"const": "REQUEST_SUCCEEDED"},
+        "Results": {
+            "type": "object",
+            "required": ["series"],
+            "properties": {"series": {"type": "array", "minItems": 1}}
+        }
+    }
+})
+_REMOTIVE_V = _compile_schema({
+    "type": "object",
+    "required": ["jobs"],
+    "properties": {"jobs": {"type": "array"}}
+})
+_NEWS_V = _compile_schema({
+    "type": "object",
+    "required": ["articles"],
+    "properties": {"articles": {"type": "array"}}
+})
+
+def _alive(session, url, timeout=3):
+    """Cheap HEAD preflight so an unreachable endpoint fails fast"""
+    try:
+        return session.head(url, timeout=timeout, allow_redirects=True).status_code < 500
+    except Exception:
+        return False
+
+def test_arxiv_api(log=print):
     """Test ArXiv API connection"""
-    print("Testing ArXiv API...")
+    log("\nTesting ArXiv API...")
     url = "http://export.arxiv.org/api/query"
     params = {
         "search_query": "all:artificial intelligence AND (labor market OR employment OR jobs)",
         "start": 0,
-        "max_results": 5,
+        "max_results": 1,  # Liveness check only needs a single entry
         "sortBy": "submittedDate",
         "sortOrder": "descending"
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
-        print(f"Status code: {response.status_code}")
+        response = SESSION.get(url, params=params, timeout=10)
+        log(f"Status code: {response.status_code}")
         if response.status_code == 200:
-            print("✅ ArXiv API connection successful")
-            print(f"Response length: {len(response.text)} characters")
-            return True
+            log("✅ ArXiv API connection successful")
+            log(f"Response length: {len(response.content)} bytes")
+            return _result(True, response)
         else:
-            print("❌ ArXiv API connection failed")
-            print(f"Response: {response.text[:200]}...")
-            return False
+            log("❌ ArXiv API connection failed")
+            log(f"Response: {response.content[:200].decode('utf-8', 'replace')}...")
+            return _result(False, response)
     except Exception as e:
-        print(f"❌ ArXiv API connection error: {str(e)}")
-        return False
+        log(f"❌ ArXiv API connection error: {str(e)}")
+        return _result(False, error=str(e))
 
-def test_bls_api(api_key=None):
+def test_bls_api(api_key=None, log=print):
     """Test BLS API connection"""
-    print("\nTesting BLS API...")
+    log("\nTesting BLS API...")
     url = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
     headers = {"Content-Type": "application/json"}
     
-    # Request data for Information sector employment
+    # Request only the current year of Information sector employment, without
+    # catalog or derived series; the probe only checks the response status
+    current_year = str(datetime.now().year)
     payload = {
         "seriesid": ["CEU6054130001"],  # Information sector employment
-        "startyear": "2022",
-        "endyear": "2023",
+        "startyear": current_year,
+        "endyear": current_year,
+        "catalog": False,
+        "calculations": False,
+        "annualaverage": False
     }
     
     # Add API key if provided
     if api_key:
         payload["registrationKey"] = api_key
-        print("Using provided BLS API key")
+        log("Using provided BLS API key")
     else:
-        print("No BLS API key provided (limited to 50 requests/day)")
+        log("No BLS API key provided (limited to 50 requests/day)")
+    
+    if not _alive(SESSION, url):
+        log("❌ BLS API endpoint unreachable (HEAD)")
+        return _result(False, error="endpoint unreachable (HEAD)")
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
-        print(f"Status code: {response.status_code}")
+        response = SESSION.post(url, headers=headers, json=payload, timeout=10)
+        log(f"Status code: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             if data["status"] == "REQUEST_SUCCEEDED":
-                print("✅ BLS API connection successful")
-                print(f"Response status: {data['status']}")
-                return True
+                try:
+                    _BLS_V(data)
+                except _SchemaError as e:
+                    log(f"❌ BLS API response failed schema validation: {e}")
+                    return _result(False, response, error=str(e))
+                log("✅ BLS API connection successful")
+                log(f"Response status: {data['status']}")
+                return _result(True, response)
             else:
-                print(f"❌ BLS API request failed: {data['status']}")
-                print(f"Message: {data.get('message', 'No message')}")
-                return False
+                log(f"❌ BLS API request failed: {data['status']}")
+                log(f"Message: {data.get('message', 'No message')}")
+                return _result(False, response, error=data.get('message', data['status']))
         else:
-            print("❌ BLS API connection failed")
-            print(f"Response: {response.text[:200]}...")
-            return False
+            log("❌ BLS API connection failed")
+            log(f"Response: {response.content[:200].decode('utf-8', 'replace')}...")
+            return _result(False, response)
     except Exception as e:
-        print(f"❌ BLS API connection error: {str(e)}")
-        return False
+        log(f"❌ BLS API connection error: {str(e)}")
+        return _result(False, error=str(e))
 
-def test_remote_jobs_api():
+def test_remote_jobs_api(log=print):
     """Test Remote Jobs API connection"""
-    print("\nTesting Remote Jobs API...")
+    log("\nTesting Remote Jobs API...")
     url = "https://remotive.com/api/remote-jobs"
-    params = {"category": "software-dev"}
+    params = {"category": "software-dev", "limit": 50}  # A sample is enough to verify liveness
     
     try:
-        response = requests.get(url, params=params, timeout=10)
-        print(f"Status code: {response.status_code}")
+        response = SESSION.get(url, params=params, timeout=10)
+        log(f"Status code: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
-            jobs_count = len(data.get("jobs", []))
-            print("✅ Remote Jobs API connection successful")
-            print(f"Found {jobs_count} jobs")
+            data = _json_loads(response.content)
+            try:
+                _REMOTIVE_V(data)
+            except _SchemaError as e:
+                log(f"❌ Remote Jobs API response failed schema validation: {e}")
+                return _result(False, response, error=str(e))
+            jobs = data.get("jobs") or []
+            jobs_count = len(jobs)
+            log("✅ Remote Jobs API connection successful")
+            log(f"Found {jobs_count} jobs")
             
             # Check for AI-related jobs
-            ai_jobs = [
-                job for job in data.get("jobs", [])
-                if any(kw in job.get("title", "").lower() or kw in job.get("description", "").lower() 
-                       for kw in ["ai", "artificial intelligence", "machine learning", "ml", "deep learning"])
-            ]
-            print(f"Found {len(ai_jobs)} AI-related jobs")
-            return True
+            ai_jobs = [job for job in jobs if _is_ai_job(job)]
+            log(f"Found {len(ai_jobs)} AI-related jobs")
+            return _result(True, response)
         else:
-            print("❌ Remote Jobs API connection failed")
-            print(f"Response: {response.text[:200]}...")
-            return False
+            log("❌ Remote Jobs API connection failed")
+            log(f"Response: {response.content[:200].decode('utf-8', 'replace')}...")
+            return _result(False, response)
     except Exception as e:
-        print(f"❌ Remote Jobs API connection error: {str(e)}")
-        return False
+        log(f"❌ Remote Jobs API connection error: {str(e)}")
+        return _result(False, error=str(e))
 
-def test_news_api(api_key):
+def test_news_api(api_key, log=print):
     """Test News API connection"""
     if not api_key:
-        print("\nSkipping News API test - API key required")
-        return False
+        log("\nSkipping News API test - API key required")
+        return _result(False, skipped=True)
         
-    print("\nTesting News API...")
+    log("\nTesting News API...")
     url = "https://newsapi.org/v2/everything"
     params = {
         "q": "AI layoffs hiring",
         "apiKey": api_key,
-        "pageSize": 5,
+        "pageSize": 1,  # Article count isn't asserted
         "language": "en",
         "sortBy": "publishedAt"
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
-        print(f"Status code: {response.status_code}")
+        response = SESSION.get(url, params=params, timeout=10)
+        log(f"Status code: {response.status_code}")
         if response.status_code == 200:
-            data = response.json()
-            articles_count = len(data.get("articles", []))
-            print("✅ News API connection successful")
-            print(f"Found {articles_count} articles")
-            return True
+            data = _json_loads(response.content)
+            try:
+                _NEWS_V(data)
+            except _SchemaError as e:
+                log(f"❌ News API response failed schema validation: {e}")
+                return _result(False, response, error=str(e))
+            articles = data.get("articles") or []
+            articles_count = len(articles)
+            log("✅ News API connection successful")
+            log(f"Found {articles_count} articles")
+            return _result(True, response)
         else:
-            print("❌ News API connection failed")
-            print(f"Response: {response.text[:200]}...")
-            return False
+            log("❌ News API connection failed")
+            log(f"Response: {response.content[:200].decode('utf-8', 'replace')}...")
+            return _result(False, response)
     except Exception as e:
-        print(f"❌ News API connection error: {str(e)}")
-        return False
+        log(f"❌ News API connection error: {str(e)}")
+        return _result(False, error=str(e))
 
 if __name__ == "__main__":
-    print("===== API CONNECTION TESTER =====")
-    print("Testing connections to data sources for AI Labor Market Index\n")
+    # API keys come from flags or environment variables; never block on stdin
+    parser = argparse.ArgumentParser(description='Test connections to AI Labor Market Index data sources')
+    parser.add_argument('--bls-key', default=os.environ.get("BLS_API_KEY"), help='BLS API key (default: $BLS_API_KEY)')
+    parser.add_argument('--news-key', default=os.environ.get("NEWS_API_KEY"), help='News API key (default: $NEWS_API_KEY)')
+    parser.add_argument('--json', action='store_true', help='Emit machine-readable JSON results instead of the report')
+    args = parser.parse_args()
     
-    # Get API keys from environment variables or input
-    bls_api_key = os.environ.get("BLS_API_KEY")
-    if not bls_api_key:
-        bls_api_key = input("Enter BLS API key (optional, press Enter to skip): ").strip()
-        if not bls_api_key:
-            bls_api_key = None
+    bls_api_key = args.bls_key or None
+    news_api_key = args.news_key or None
     
-    news_api_key = os.environ.get("NEWS_API_KEY")
-    if not news_api_key:
-        news_api_key = input("Enter News API key (optional, press Enter to skip): ").strip()
-        if not news_api_key:
-            news_api_key = None
+    # Human-readable output is buffered and written to stdout once at the end
+    buf = io.StringIO()
+    buf.write("===== API CONNECTION TESTER =====\n")
+    buf.write("Testing connections to data sources for AI Labor Market Index\n\n")
     
-    # Run tests
-    arxiv_success = test_arxiv_api()
-    bls_success = test_bls_api(bls_api_key)
-    remote_jobs_success = test_remote_jobs_api()
-    news_success = test_news_api(news_api_key)
+    # Run tests concurrently; requests releases the GIL while waiting on sockets
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(_run_buffered, test_arxiv_api, buf): "arxiv",
+            executor.submit(_run_buffered, test_bls_api, buf, bls_api_key): "bls",
+            executor.submit(_run_buffered, test_remote_jobs_api, buf): "remote_jobs",
+            executor.submit(_run_buffered, test_news_api, buf, news_api_key): "news"
+        }
+        results = {futures[future]: future.result() for future in as_completed(futures)}
     
-    # Summary
-    print("\n===== TEST SUMMARY =====")
-    print(f"ArXiv API: {'✅ SUCCESS' if arxiv_success else '❌ FAILED'}")
-    print(f"BLS API: {'✅ SUCCESS' if bls_success else '❌ FAILED'}")
-    print(f"Remote Jobs API: {'✅ SUCCESS' if remote_jobs_success else '❌ FAILED'}")
-    print(f"News API: {'✅ SUCCESS' if news_success else '❌ FAILED or SKIPPED'}")
-    
-    # Overall assessment
-    working_apis = sum([arxiv_success, bls_success, remote_jobs_success, news_success])
-    total_apis = 4
-    
-    print(f"\n{working_apis}/{total_apis} APIs are working correctly")
-    
-    if working_apis == 0:
-        print("\n❌ CRITICAL: All APIs are failing. Check your internet connection.")
-    elif working_apis < total_apis:
-        print("\n⚠️ WARNING: Some APIs are failing. Review the output above for details.")
+    if args.json:
+        sys.stdout.write(_json_dumps(results) + "\n")
     else:
-        print("\n✅ SUCCESS: All APIs are working correctly.")
\ No newline at end of file
+        _human_summary(results, buf)
+        sys.stdout.write(buf.getvalue())
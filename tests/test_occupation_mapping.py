@@ -1,88 +1,209 @@
 import unittest
+import pytest
 import os
+import re
 import sys
+import io
 import json
+import builtins
 import tempfile
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
 
+from utils import soc_code_mapper
 from utils.soc_code_mapper import SOCCodeMapper
 from processing.process_anthropic_occupation_data import AnthropicOccupationProcessor
+from analysis import occupation_industry_mapper
 from analysis.occupation_industry_mapper import OccupationIndustryMapper
+from validation import validate_occupation_mapping
 from validation.validate_occupation_mapping import OccupationMappingValidator
 
+# Shared mock inputs. The code under test only reads them, so tests use them
+# directly; copy one before assigning into it
 
-class TestSOCCodeMapper(unittest.TestCase):
-    """Test SOC code standardization utilities"""
+def _make_anthropic_data(software_confidence=0.85, teacher_confidence=0.9):
+    """Mock Anthropic data; only the per-occupation confidences vary between tests"""
+    return {
+        "occupation_automation": {
+            "15-1252": {"automation_rate": 0.7, "confidence": software_confidence},
+            "25-1071": {"automation_rate": 0.3, "confidence": teacher_confidence}
+        },
+        "occupation_usage": {
+            "15-1252": {"usage_score": 0.8, "adoption_rate": 0.6},
+            "25-1071": {"usage_score": 0.4, "adoption_rate": 0.2}
+        }
+    }
+
+
+# Mock Anthropic data
+_MOCK_ANTHROPIC_DATA = _make_anthropic_data()
+
+# Mock employment data (structure expected by the mapper)
+_MOCK_EMPLOYMENT = {
+    "5415": {  # Computer Systems Design
+        "15-1252": {"employment": 50000, "wages": 85000},  # Software Developers
+        "15-1299": {"employment": 10000, "wages": 75000}   # Other Computer Workers
+    },
+    "5412": {  # Accounting Services
+        "13-2011": {"employment": 30000, "wages": 65000},  # Accountants
+        "43-3031": {"employment": 20000, "wages": 45000}   # Bookkeepers
+    }
+}
+
+# Mock occupation impact data
+_MOCK_OCCUPATION_IMPACTS = {
+    "15-1252": {"automation_rate": 0.7, "augmentation_rate": 0.8},
+    "15-1299": {"automation_rate": 0.6, "augmentation_rate": 0.7},
+    "13-2011": {"automation_rate": 0.4, "augmentation_rate": 0.5},
+    "43-3031": {"automation_rate": 0.8, "augmentation_rate": 0.9}
+}
+
+# Mock mapping results
+_MOCK_MAPPING_RESULTS = {
+    "5415": {
+        "automation_rate": 0.65,
+        "augmentation_rate": 0.75,
+        "confidence_score": 0.8,
+        "employment_coverage": 0.9,
+        "occupation_count": 15
+    },
+    "5412": {
+        "automation_rate": 0.45,
+        "augmentation_rate": 0.55,
+        "confidence_score": 0.7,
+        "employment_coverage": 0.85,
+        "occupation_count": 12
+    }
+}
+
+# Mock inputs for the end-to-end pipeline test
+_PIPELINE_ANTHROPIC_DATA = _make_anthropic_data(software_confidence=0.8)
+
+_PIPELINE_EMPLOYMENT = {
+    "5415": {"15-1252": {"employment": 50000}},
+    "6111": {"25-1071": {"employment": 30000}}
+}
+
+# Serialized once; the pipeline test reads them back through the real json.load
+_PIPELINE_FILES = {
+    "anthropic_economic_index.json": json.dumps(_PIPELINE_ANTHROPIC_DATA).encode(),
+    "bls_occupation_employment.json": json.dumps(_PIPELINE_EMPLOYMENT).encode()
+}
+
+# Mock baseline results for comparison
+_MOCK_BASELINE = {
+    "5415": {"automation_rate": 0.6, "augmentation_rate": 0.7},
+    "5412": {"automation_rate": 0.5, "augmentation_rate": 0.6}
+}
+
+
+@pytest.fixture(scope="module")
+def mapper():
+    return SOCCodeMapper()
+
+
+@pytest.fixture
+def patched_fs(monkeypatch):
+    """Serve the pipeline files from memory, dispatched by file name"""
+    real_open, real_exists = builtins.open, os.path.exists
     
-    def setUp(self):
-        self.mapper = SOCCodeMapper()
+    def fake_open(path, *args, **kwargs):
+        name = os.path.basename(path)
+        if name in _PIPELINE_FILES:
+            return io.BytesIO(_PIPELINE_FILES[name])
+        # Anything else is read from disk
+        return real_open(path, *args, **kwargs)
+    
+    monkeypatch.setattr(os.path, 'exists',
+                        lambda path: os.path.basename(path) in _PIPELINE_FILES or real_exists(path))
+    monkeypatch.setattr(builtins, 'open', fake_open)
+
+
+@pytest.fixture
+def missing_fs(monkeypatch):
+    """No data file exists"""
+    monkeypatch.setattr(os.path, 'exists', lambda path: False)
+
+
+class UnitIntervalAssertions:
+    """Mixin for unittest cases checking scores and rates lie in [0, 1]"""
+    
+    def assertInUnitInterval(self, value, msg=None):
+        if not 0.0 <= value <= 1.0:
+            self.fail(self._formatMessage(msg, f"{value!r} not in [0, 1]"))
+
+
+class TestSOCCodeMapper:
+    """Test SOC code standardization utilities"""
     
-    def test_standardize_soc_code_formats(self):
+    @pytest.mark.parametrize("input_code,expected", [
+        ("15-1252", "15-1252"),
+        ("151252", "15-1252"),
+        ("15.1252", "15-1252"),
+        ("15 1252", "15-1252"),
+        ("15-1252.00", "15-1252"),  # This pattern is supported
+        ("151252.00", None),   # This pattern isn't supported
+        ("15-1252 Software Developers", None),  # Text not supported
+        ("", None),
+        (None, None),
+        ("invalid", None),
+        ("15-999999", None)  # Invalid SOC code
+    ])
+    def test_standardize_soc_code_formats(self, mapper, input_code, expected):
         """Test various SOC code format standardizations"""
-        test_cases = [
-            ("15-1252", "15-1252"),
-            ("151252", "15-1252"),
-            ("15.1252", "15-1252"),
-            ("15 1252", "15-1252"),
-            ("15-1252.00", "15-1252"),  # This pattern is supported
-            ("151252.00", None),   # This pattern isn't supported
-            ("15-1252 Software Developers", None),  # Text not supported
-            ("", None),
-            (None, None),
-            ("invalid", None),
-            ("15-999999", None)  # Invalid SOC code
-        ]
-        
-        for input_code, expected in test_cases:
-            with self.subTest(input_code=input_code):
-                result = self.mapper.standardize_soc_code(input_code)
-                self.assertEqual(result, expected)
-    
-    def test_get_ai_susceptibility_defaults(self):
+        assert mapper.standardize_soc_code(input_code) == expected
+    
+    def test_regex_precompiled(self):
+        """Test the SOC format pattern is compiled once at import"""
+        assert isinstance(soc_code_mapper._SOC_RE, re.Pattern)
+    
+    def test_repeated_codes_parsed_once(self, mapper):
+        """Test repeated codes reuse the cached parse and still check the major group"""
+        soc_code_mapper._parse_soc_code.cache_clear()
+        for _ in range(3):
+            assert mapper.standardize_soc_code("15.1252") == "15-1252"
+            assert mapper.standardize_soc_code("99.1234") is None
+        assert soc_code_mapper._parse_soc_code.cache_info().misses == 2
+    
+    def test_get_ai_susceptibility_defaults(self, mapper):
         """Test AI susceptibility defaults by major group"""
         # Test known high-susceptibility occupation
-        susceptibility = self.mapper.get_ai_susceptibility_defaults("15-1252")  # Software Developers
-        self.assertIsInstance(susceptibility, dict)
-        self.assertIn("automation", susceptibility)
-        self.assertIn("augmentation", susceptibility)
-        self.assertGreaterEqual(susceptibility["automation"], 0.0)
-        self.assertLessEqual(susceptibility["automation"], 1.0)
+        susceptibility = mapper.get_ai_susceptibility_defaults("15-1252")  # Software Developers
+        assert isinstance(susceptibility, dict)
+        assert "automation" in susceptibility
+        assert "augmentation" in susceptibility
+        assert 0.0 <= susceptibility["automation"] <= 1.0
         
         # Test unknown occupation falls back to general default
-        unknown_susceptibility = self.mapper.get_ai_susceptibility_defaults("99-9999")
-        self.assertIsInstance(unknown_susceptibility, dict)
-        self.assertIn("automation", unknown_susceptibility)
-        self.assertIn("augmentation", unknown_susceptibility)
+        unknown_susceptibility = mapper.get_ai_susceptibility_defaults("99-9999")
+        assert isinstance(unknown_susceptibility, dict)
+        assert "automation" in unknown_susceptibility
+        assert "augmentation" in unknown_susceptibility
     
-    def test_validate_soc_code(self):
+    @pytest.mark.parametrize("soc_code,expected", [
+        ("15-1252", True),
+        ("25-1071", True),
+        ("99-9999", False),  # Invalid range
+        ("15-99999", False),  # Too many digits
+        ("invalid", False)
+    ])
+    def test_validate_soc_code(self, mapper, soc_code, expected):
         """Test SOC code validation"""
-        self.assertTrue(self.mapper._validate_soc_code("15-1252"))
-        self.assertTrue(self.mapper._validate_soc_code("25-1071"))
-        self.assertFalse(self.mapper._validate_soc_code("99-9999"))  # Invalid range
-        self.assertFalse(self.mapper._validate_soc_code("15-99999"))  # Too many digits
-        self.assertFalse(self.mapper._validate_soc_code("invalid"))
+        assert mapper._validate_soc_code(soc_code) is expected
 
 
 class TestAnthropicOccupationProcessor(unittest.TestCase):
     """Test Anthropic occupation data processing"""
     
-    def setUp(self):
-        self.processor = AnthropicOccupationProcessor()
-        
-        # Create mock Anthropic data
-        self.mock_anthropic_data = {
-            "occupation_automation": {
-                "15-1252": {"automation_rate": 0.7, "confidence": 0.85},
-                "25-1071": {"automation_rate": 0.3, "confidence": 0.9}
-            },
-            "occupation_usage": {
-                "15-1252": {"usage_score": 0.8, "adoption_rate": 0.6},
-                "25-1071": {"usage_score": 0.4, "adoption_rate": 0.2}
-            }
-        }
+    mock_anthropic_data = _MOCK_ANTHROPIC_DATA
+    
+    @classmethod
+    def setUpClass(cls):
+        # process_anthropic_data resets the processor's state on every call
+        cls.processor = AnthropicOccupationProcessor()
     
     def test_process_anthropic_data(self):
         """Test processing of Anthropic occupation data"""
@@ -112,6 +233,18 @@ class TestAnthropicOccupationProcessor(unittest.TestCase):
         self.assertIn("occupation_impacts", result)
         self.assertIn("processing_stats", result)
     
+    def test_out_of_range_rates_clamped(self):
+        """Test processed rates are clamped to [0, 1]"""
+        result = self.processor.process_anthropic_data({"occupations": [
+            {"title": "Software Developers", "soc_code": "15-1252", "automation_rate": 150, "augmentation_rate": -0.2},
+            {"title": "Accountants", "soc_code": "13-2011", "automation_rate": 0.4, "augmentation_rate": 0.5}
+        ]})
+        
+        impacts = result["occupation_impacts"]
+        self.assertEqual(impacts["15-1252"]["automation_rate"], 1.0)
+        self.assertEqual(impacts["15-1252"]["augmentation_rate"], 0.0)
+        self.assertEqual(impacts["13-2011"]["automation_rate"], 0.4)
+    
     def test_invalid_data_handling(self):
         """Test handling of invalid data formats"""
         # Test with empty dict (None would cause error, which is expected)
@@ -126,28 +259,19 @@ class TestAnthropicOccupationProcessor(unittest.TestCase):
 class TestOccupationIndustryMapper(unittest.TestCase):
     """Test occupation-industry mapping calculations"""
     
+    mock_employment_data = _MOCK_EMPLOYMENT
+    mock_occupation_data = _MOCK_OCCUPATION_IMPACTS
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.mapper = OccupationIndustryMapper()
+    
     def setUp(self):
-        self.mapper = OccupationIndustryMapper()
-        
-        # Mock employment data (structure expected by the mapper)
-        self.mock_employment_data = {
-            "5415": {  # Computer Systems Design
-                "15-1252": {"employment": 50000, "wages": 85000},  # Software Developers
-                "15-1299": {"employment": 10000, "wages": 75000}   # Other Computer Workers
-            },
-            "5412": {  # Accounting Services
-                "13-2011": {"employment": 30000, "wages": 65000},  # Accountants
-                "43-3031": {"employment": 20000, "wages": 45000}   # Bookkeepers
-            }
-        }
-        
-        # Mock occupation impact data
-        self.mock_occupation_data = {
-            "15-1252": {"automation_rate": 0.7, "augmentation_rate": 0.8},
-            "15-1299": {"automation_rate": 0.6, "augmentation_rate": 0.7},
-            "13-2011": {"automation_rate": 0.4, "augmentation_rate": 0.5},
-            "43-3031": {"automation_rate": 0.8, "augmentation_rate": 0.9}
-        }
+        # Tests load or assign data directly, so clear it between them
+        self.mapper.occupation_impacts = {}
+        self.mapper.occupation_employment = {}
+        self.mapper.industry_rates = {}
+        self.mapper.mapping_metadata["data_sources"] = {}
     
     def test_calculate_industry_automation_rates(self):
         """Test employment-weighted automation rate calculation"""
@@ -160,13 +284,11 @@ class TestOccupationIndustryMapper(unittest.TestCase):
         # Should return a valid result structure
         self.assertIsInstance(result, dict)
         
-        # Check that results are generated for known industries
-        if result:  # If calculation succeeded
-            for industry_code, rates in result.items():
-                self.assertIn("automation_rate", rates)
-                self.assertIn("augmentation_rate", rates)
-                self.assertGreaterEqual(rates["automation_rate"], 0.0)
-                self.assertLessEqual(rates["automation_rate"], 1.0)
+        # Check that results are generated for known industries, all in [0, 1]
+        self.assertEqual(set(result), set(self.mock_employment_data))
+        rates = np.array([[r["automation_rate"], r["augmentation_rate"]] for r in result.values()])
+        out_of_range = (rates < 0.0) | (rates > 1.0)
+        self.assertFalse(out_of_range.any(), f"Rates outside [0, 1]: {rates[out_of_range]}")
     
     def test_fallback_with_missing_employment(self):
         """Test fallback behavior when employment data is missing"""
@@ -190,6 +312,36 @@ class TestOccupationIndustryMapper(unittest.TestCase):
         # Check internal data structure is initialized
         self.assertIsInstance(self.mapper.occupation_employment, dict)
     
+    def test_bls_file_parsed_once_per_version(self):
+        """Test BLS employment files are only re-parsed when they change"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bls_file = os.path.join(tmpdir, "bls_occupation_employment.json")
+            with open(bls_file, 'w') as f:
+                json.dump(_MOCK_EMPLOYMENT, f)
+            
+            with patch('analysis.occupation_industry_mapper._parse_bls_file',
+                       wraps=occupation_industry_mapper._parse_bls_file) as mock_parse:
+                self.mapper.load_data_sources(bls_file=bls_file, auto_discover=False)
+                OccupationIndustryMapper().load_data_sources(bls_file=bls_file, auto_discover=False)
+                self.assertEqual(mock_parse.call_count, 1)
+                self.assertEqual(self.mapper.occupation_employment, _MOCK_EMPLOYMENT)
+                
+                # A newer modification time invalidates the cached parse
+                stat = os.stat(bls_file)
+                os.utime(bls_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                self.mapper.load_data_sources(bls_file=bls_file, auto_discover=False)
+                self.assertEqual(mock_parse.call_count, 2)
+    
+    def test_bls_collector_output_loading(self):
+        """Test the collector's wrapped output loads as the bare employment matrix"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bls_file = os.path.join(tmpdir, "bls_occupation_employment.json")
+            with open(bls_file, 'w') as f:
+                json.dump({"employment_matrix": _MOCK_EMPLOYMENT, "metadata": {"data_year": 2024}}, f)
+            
+            self.mapper.load_data_sources(bls_file=bls_file, auto_discover=False)
+            self.assertEqual(self.mapper.occupation_employment, _MOCK_EMPLOYMENT)
+    
     def test_confidence_scoring(self):
         """Test confidence score calculation"""
         # Set known data  
@@ -209,35 +361,15 @@ class TestOccupationIndustryMapper(unittest.TestCase):
         self.assertIsInstance(result, dict)
 
 
-class TestOccupationMappingValidator(unittest.TestCase):
+class TestOccupationMappingValidator(UnitIntervalAssertions, unittest.TestCase):
     """Test occupation mapping validation framework"""
     
-    def setUp(self):
-        self.validator = OccupationMappingValidator()
-        
-        # Mock mapping results
-        self.mock_mapping_results = {
-            "5415": {
-                "automation_rate": 0.65,
-                "augmentation_rate": 0.75,
-                "confidence_score": 0.8,
-                "employment_coverage": 0.9,
-                "occupation_count": 15
-            },
-            "5412": {
-                "automation_rate": 0.45,
-                "augmentation_rate": 0.55,
-                "confidence_score": 0.7,
-                "employment_coverage": 0.85,
-                "occupation_count": 12
-            }
-        }
-        
-        # Mock baseline results for comparison
-        self.mock_baseline = {
-            "5415": {"automation_rate": 0.6, "augmentation_rate": 0.7},
-            "5412": {"automation_rate": 0.5, "augmentation_rate": 0.6}
-        }
+    mock_mapping_results = _MOCK_MAPPING_RESULTS
+    mock_baseline = _MOCK_BASELINE
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.validator = OccupationMappingValidator()
     
     def test_validate_mapping_quality(self):
         """Test overall mapping quality validation"""
@@ -250,8 +382,7 @@ class TestOccupationMappingValidator(unittest.TestCase):
         
         # Overall score should be between 0 and 1
         score = quality_report["overall_quality_score"]
-        self.assertGreaterEqual(score, 0.0)
-        self.assertLessEqual(score, 1.0)
+        self.assertInUnitInterval(score)
         
         # Quality checks should contain individual check results
         checks = quality_report["quality_checks"]
@@ -260,6 +391,39 @@ class TestOccupationMappingValidator(unittest.TestCase):
         self.assertIn("reasonableness", checks)
         self.assertIn("confidence", checks)
     
+    def test_rate_fields_extracted_once(self):
+        """Test a full validation shares one extraction of the rate fields across checks"""
+        with patch('validation.validate_occupation_mapping._rate_arrays',
+                   wraps=validate_occupation_mapping._rate_arrays) as mock_extract:
+            self.validator.validate_mapping_quality(self.mock_mapping_results)
+        self.assertEqual(mock_extract.call_count, 1)
+    
+    def test_validate_empty_mapping(self):
+        """Test that empty input fails fast without running the checks"""
+        quality_report = self.validator.validate_mapping_quality({})
+        
+        self.assertFalse(quality_report["validation_passed"])
+        self.assertEqual(quality_report["overall_quality_score"], 0.0)
+        self.assertEqual(quality_report["errors"], ["No industry rates provided"])
+        self.assertEqual(quality_report["quality_checks"], {})
+    
+    def test_quick_validation_stops_when_failing(self):
+        """Test quick validation skips the remaining checks once the mapping cannot pass"""
+        failing_data = {
+            "5415": {"automation_rate": 0.95, "augmentation_rate": 0.95,
+                     "confidence": 0.1, "data_coverage": 0.1}
+        }
+        
+        quick_report = self.validator.validate_mapping_quality(failing_data, thorough=False)
+        full_report = self.validator.validate_mapping_quality(failing_data)
+        
+        self.assertFalse(quick_report["validation_passed"])
+        self.assertEqual(quick_report["skipped_checks"], ["consistency", "reasonableness"])
+        self.assertEqual(set(quick_report["quality_checks"]), {"coverage", "confidence"})
+        self.assertFalse(full_report["validation_passed"])
+        self.assertNotIn("skipped_checks", full_report)
+        self.assertGreater(len(quick_report["recommendations"]), 0)
+    
     def test_coverage_validation(self):
         """Test employment coverage validation"""
         coverage_result = self.validator._validate_coverage(self.mock_mapping_results)
@@ -269,8 +433,7 @@ class TestOccupationMappingValidator(unittest.TestCase):
         self.assertIn("warnings", coverage_result)
         
         score = coverage_result["quality_score"]
-        self.assertGreaterEqual(score, 0.0)
-        self.assertLessEqual(score, 1.0)
+        self.assertInUnitInterval(score)
     
     def test_consistency_validation(self):
         """Test rate consistency validation"""
@@ -280,8 +443,7 @@ class TestOccupationMappingValidator(unittest.TestCase):
         self.assertIn("warnings", consistency_result)
         
         score = consistency_result["quality_score"]
-        self.assertGreaterEqual(score, 0.0)
-        self.assertLessEqual(score, 1.0)
+        self.assertInUnitInterval(score)
     
     def test_baseline_comparison(self):
         """Test comparison with baseline methodology"""
@@ -295,8 +457,27 @@ class TestOccupationMappingValidator(unittest.TestCase):
         self.assertIn("improvement_metrics", comparison)
         self.assertIn("change_summary", comparison)
         
-        # Should have compared some industries
-        self.assertGreaterEqual(comparison["industries_compared"], 0)
+        # Both mock industries are in the baseline, and none moved by more than 0.1
+        self.assertEqual(comparison["industries_compared"], 2)
+        self.assertEqual(comparison["significant_changes"], [])
+        self.assertAlmostEqual(comparison["change_summary"]["avg_automation_change"], 0.0)
+    
+    def test_baseline_comparison_flags_significant_changes(self):
+        """Test large rate moves are flagged, in new-rate order, over shared industries only"""
+        baseline = {
+            "5412": {"automation_rate": 0.2, "augmentation_rate": 0.55, "confidence": 0.5},
+            "5415": {"automation_rate": 0.65, "augmentation_rate": 0.9, "confidence": 0.5},
+            "1111": {"automation_rate": 0.1, "augmentation_rate": 0.1}
+        }
+        
+        comparison = self.validator.compare_with_baseline(self.mock_mapping_results, baseline)
+        
+        self.assertEqual(comparison["industries_compared"], 2)
+        changes = comparison["significant_changes"]
+        self.assertEqual([change["industry"] for change in changes], ["5415", "5412"])
+        self.assertAlmostEqual(changes[0]["augmentation_change"], -0.15)
+        self.assertAlmostEqual(changes[1]["automation_change"], 0.25)
+        self.assertEqual(comparison["change_summary"]["industries_with_higher_automation"], 1)
     
     def test_recommendation_generation(self):
         """Test quality recommendation generation"""
@@ -325,47 +506,32 @@ class TestOccupationMappingValidator(unittest.TestCase):
         )
 
 
-class TestIntegrationScenarios(unittest.TestCase):
+class TestIntegrationScenarios(UnitIntervalAssertions, unittest.TestCase):
     """Test end-to-end integration scenarios"""
     
+    @classmethod
+    def setUpClass(cls):
+        cls.processor = AnthropicOccupationProcessor()
+        cls.industry_mapper = OccupationIndustryMapper()
+        cls.validator = OccupationMappingValidator()
+    
     def setUp(self):
-        self.soc_mapper = SOCCodeMapper()
-        self.processor = AnthropicOccupationProcessor()
-        self.industry_mapper = OccupationIndustryMapper()
-        self.validator = OccupationMappingValidator()
-    
-    @patch('os.path.exists')
-    @patch('builtins.open')
-    @patch('json.load')
-    def test_full_pipeline_with_mock_data(self, mock_json_load, mock_open, mock_exists):
+        # Tests load or assign mapper data directly, so clear it between them
+        self.industry_mapper.occupation_impacts = {}
+        self.industry_mapper.occupation_employment = {}
+        self.industry_mapper.industry_rates = {}
+        self.industry_mapper.mapping_metadata["data_sources"] = {}
+    
+    @pytest.mark.usefixtures("patched_fs")
+    def test_full_pipeline_with_mock_data(self):
         """Test complete occupation mapping pipeline"""
-        mock_exists.return_value = True
-        
-        # Mock Anthropic data file
-        mock_anthropic_data = {
-            "occupation_automation": {
-                "15-1252": {"automation_rate": 0.7, "confidence": 0.8},
-                "25-1071": {"automation_rate": 0.3, "confidence": 0.9}
-            },
-            "occupation_usage": {
-                "15-1252": {"usage_score": 0.8, "adoption_rate": 0.6},
-                "25-1071": {"usage_score": 0.4, "adoption_rate": 0.2}
-            }
-        }
-        
-        # Mock employment data
-        mock_employment_data = {
-            "5415": {"15-1252": {"employment": 50000}},
-            "6111": {"25-1071": {"employment": 30000}}
-        }
-        
-        mock_json_load.side_effect = [mock_anthropic_data, mock_employment_data]
-        
         # Process occupation data
-        occupation_data = self.processor.process_anthropic_data("mock_file.json")
+        with open("anthropic_economic_index.json", "rb") as f:
+            occupation_data = self.processor.process_anthropic_data(json.load(f))
         
         # Set data and calculate industry rates
-        self.industry_mapper.occupation_employment = mock_employment_data
+        with open("bls_occupation_employment.json", "rb") as f:
+            self.industry_mapper.occupation_employment = json.load(f)
         self.industry_mapper.occupation_impacts = occupation_data.get("occupation_impacts", {})
         industry_rates = self.industry_mapper.calculate_industry_automation_rates()
         
@@ -379,19 +545,17 @@ class TestIntegrationScenarios(unittest.TestCase):
         for industry_code, rates in industry_rates.items():
             self.assertIn("automation_rate", rates)
             self.assertIn("augmentation_rate", rates)
-            self.assertGreaterEqual(rates["automation_rate"], 0.0)
-            self.assertLessEqual(rates["automation_rate"], 1.0)
+            self.assertInUnitInterval(rates["automation_rate"])
     
+    @pytest.mark.usefixtures("missing_fs")
     def test_fallback_handling(self):
         """Test graceful fallback when occupation data unavailable"""
-        # Test with missing files
-        with patch('os.path.exists', return_value=False):
-            # Load data sources (should fail gracefully)
-            success = self.industry_mapper.load_data_sources(auto_discover=True)
-            
-            # Calculate with empty data (should not crash)
-            result = self.industry_mapper.calculate_industry_automation_rates()
-            self.assertIsInstance(result, dict)
+        # Load data sources with missing files (should fail gracefully)
+        success = self.industry_mapper.load_data_sources(auto_discover=True)
+        
+        # Calculate with empty data (should not crash)
+        result = self.industry_mapper.calculate_industry_automation_rates()
+        self.assertIsInstance(result, dict)
     
     def test_data_quality_edge_cases(self):
         """Test handling of edge cases in data quality"""
@@ -402,13 +566,7 @@ class TestIntegrationScenarios(unittest.TestCase):
         }
         
         # Processor should handle extreme values gracefully
-        processed = {}
-        for occ_code, data in extreme_data.items():
-            # Clamp values to valid range
-            processed[occ_code] = {
-                "automation_rate": max(0.0, min(1.0, data["automation_rate"])),
-                "augmentation_rate": max(0.0, min(1.0, data["augmentation_rate"]))
-            }
+        processed = self.processor._clamp_rates(extreme_data)
         
         # Verify clamping worked
         self.assertEqual(processed["15-1252"]["automation_rate"], 1.0)
@@ -417,26 +575,5 @@ class TestIntegrationScenarios(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestSOCCodeMapper,
-        TestAnthropicOccupationProcessor,
-        TestOccupationIndustryMapper,
-        TestOccupationMappingValidator,
-        TestIntegrationScenarios
-    ]
-    
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
+    # The SOC mapper tests are pytest-style, so run the whole module through pytest
+    sys.exit(pytest.main([__file__, '-v']))
@@ -13,55 +13,97 @@ from analysis.calculate_ai_impact import AIImpactCalculator
 from analysis.project_impact import AIImpactProjector
 from analysis.confidence_intervals import ConfidenceIntervalCalculator
 
+
+# The calculators hold only their configuration, so one instance of each serves
+# the whole session
+@pytest.fixture(scope="session")
+def calculator():
+    return AIImpactCalculator()
+
+
+@pytest.fixture(scope="session")
+def projector():
+    return AIImpactProjector()
+
+
+@pytest.fixture(scope="session")
+def confidence_calculator():
+    return ConfidenceIntervalCalculator()
+
+
+# Employment data covering both net impact tests: the transformation test needs
+# prior-period levels, the bounds test a national total
+_NET_IMPACT_EMPLOYMENT = {
+    "industries": {
+        "Information": {"current": 3000000, "previous": 2800000},
+        "Manufacturing": {"current": 12000000, "previous": 12100000},
+        "Healthcare": {"current": 20000000, "previous": 19500000},
+        "Total Nonfarm": {"current": 150000000}
+    }
+}
+
+
+# Broad employment coverage for the data quality test; only read, never modified
+_GOOD_EMPLOYMENT_DATA = {
+    "industries": {f"Industry_{i}": {"current": 1000000} for i in range(10)}
+}
+
+
+@pytest.fixture(scope="session")
+def net_impact(calculator):
+    """Net impact on the shared employment data, calculated once"""
+    return calculator.calculate_net_impact(_NET_IMPACT_EMPLOYMENT, None)  # Default job data
+
+
+# Realistic bounds on the net impact result: (check, values by name, lower, upper)
+_NET_IMPACT_BOUNDS = [
+    ("total_impact", lambda result: {"total_impact": result["total_impact"]}, -0.5, 0.3),
+    ("transformation_rate", lambda result: {"transformation_rate": result["transformation_rate"]}, 0.0, 2.0),
+    ("industry_impact",
+     lambda result: {industry: data["impact"] for industry, data in result["by_industry"].items()}, -0.8, 0.5),
+    ("displacement_effect",
+     lambda result: {"displacement_effect": result["components"]["displacement_effect"]}, -0.8, 0.0),
+    ("creation_effect", lambda result: {"creation_effect": result["components"]["creation_effect"]}, 0.0, 0.5),
+    ("market_maturity", lambda result: {"market_maturity": result["components"]["market_maturity"]}, 0.0, 1.0)
+]
+
+
 class TestProjectionRealism:
     """Test suite for ensuring non-linear behavior in AI impact projections."""
 
-    def test_transformation_rate_non_linear(self):
+    def test_transformation_rate_non_linear(self, net_impact):
         """Test that transformation rate shows realistic variation"""
-        # Create test employment data
-        test_employment_data = {
-            "industries": {
-                "Information": {"current": 3000000, "previous": 2800000},
-                "Manufacturing": {"current": 12000000, "previous": 12100000},
-                "Healthcare": {"current": 20000000, "previous": 19500000}
-            }
-        }
-        
-        test_job_data = None  # Will use defaults
-        
-        # Initialize calculator
-        calculator = AIImpactCalculator()
-        
-        # Calculate impact
-        result = calculator.calculate_net_impact(test_employment_data, test_job_data)
+        result = net_impact
         
-        # Verify transformation rate exists and makes sense
+        # Verify transformation rate exists and is numeric (its bounds are in test_realistic_bounds)
         assert "transformation_rate" in result
         assert isinstance(result["transformation_rate"], (int, float))
-        assert 0 <= result["transformation_rate"] <= 2.0  # Reasonable bounds
         
         # Verify transformation by industry exists
         assert "transformation_by_industry" in result
         assert len(result["transformation_by_industry"]) > 0
         
         # Check that different industries have different transformation rates
-        transformation_values = list(result["transformation_by_industry"].values())
-        assert len(set(transformation_values)) > 1, "All industries have identical transformation rates"
+        transformation_by_industry = result["transformation_by_industry"]
+        transformation_values = np.fromiter(transformation_by_industry.values(), dtype=np.float64,
+                                            count=len(transformation_by_industry))
+        assert np.unique(transformation_values).size > 1, "All industries have identical transformation rates"
 
-    def test_confidence_intervals_realistic(self):
+    def test_confidence_intervals_realistic(self, confidence_calculator):
         """Test that confidence decreases realistically over time"""
-        calculator = ConfidenceIntervalCalculator()
-        
         # Test confidence by timeframe calculation
-        confidence_by_year = calculator.calculate_confidence_by_timeframe(5)
+        confidence_by_year = confidence_calculator.calculate_confidence_by_timeframe(5)
         
         # Verify confidence decreases over time
         years = sorted(confidence_by_year.keys())
-        confidences = [confidence_by_year[year] for year in years]
+        confidences = np.fromiter((confidence_by_year[year] for year in years), dtype=np.float64, count=len(years))
+        # Differences between consecutive years, shared by both checks below
+        diffs = np.diff(confidences)
         
         # Check that confidence generally decreases
-        for i in range(1, len(confidences)):
-            assert confidences[i] <= confidences[i-1] + 0.05, f"Confidence increased from year {years[i-1]} to {years[i]}"
+        if not np.all(diffs <= 0.05):
+            i = int(np.argmax(~(diffs <= 0.05)))
+            pytest.fail(f"Confidence increased from year {years[i]} to {years[i + 1]}")
         
         # Check bounds
         for confidence in confidences:
@@ -69,16 +111,11 @@ class TestProjectionRealism:
         
         # Check non-linear decline (not strictly linear)
         if len(confidences) >= 3:
-            # Calculate differences between consecutive years
-            diffs = [confidences[i] - confidences[i-1] for i in range(1, len(confidences))]
             # Verify the differences aren't all identical (would indicate linear decline)
-            diff_variance = np.var(diffs)
-            assert diff_variance > 0.001, "Confidence decline appears too linear"
+            assert diffs.var() > 0.001, "Confidence decline appears too linear"
 
-    def test_industry_variation(self):
+    def test_industry_variation(self, projector):
         """Test that different industries show different adoption patterns"""
-        projector = AIImpactProjector()
-        
         test_industries = ["Technology", "Healthcare", "Government", "Manufacturing"]
         
         adoption_patterns = {}
@@ -87,28 +124,27 @@ class TestProjectionRealism:
             adoptions = projector.calculate_adoption_projection(0.3, 5, industry)
             adoption_patterns[industry] = adoptions
         
-        # Verify each industry has a unique pattern
-        for i, industry1 in enumerate(test_industries):
-            for industry2 in test_industries[i+1:]:
-                pattern1 = adoption_patterns[industry1]
-                pattern2 = adoption_patterns[industry2]
-                
-                # Calculate correlation between patterns
-                correlation = np.corrcoef(pattern1, pattern2)[0, 1]
-                assert correlation < 0.95, f"{industry1} and {industry2} have nearly identical adoption patterns"
-        
-        # Verify patterns are non-linear
-        for industry, pattern in adoption_patterns.items():
-            if len(pattern) >= 3:
-                # Check for non-linear progression
-                differences = [pattern[i] - pattern[i-1] for i in range(1, len(pattern))]
-                diff_variance = np.var(differences)
-                assert diff_variance > 0.0001, f"{industry} adoption pattern appears too linear"
+        patterns = np.asarray([adoption_patterns[industry] for industry in test_industries])
+        
+        # Verify each industry has a unique pattern: correlate every pair at once
+        correlations = np.corrcoef(patterns)
+        first, second = np.triu_indices(len(test_industries), k=1)
+        # Written as "not below" so a NaN correlation (a flat pattern) also fails
+        identical = ~(correlations[first, second] < 0.95)
+        assert not identical.any(), "Nearly identical adoption patterns: " + ", ".join(
+            f"{test_industries[i]} and {test_industries[j]}" for i, j in zip(first[identical], second[identical])
+        )
+        
+        # Verify patterns are non-linear: variance of the year-over-year steps per industry
+        if patterns.shape[1] >= 3:
+            step_variances = np.var(np.diff(patterns, axis=1), axis=1)
+            linear = ~(step_variances > 0.0001)
+            assert not linear.any(), "Adoption patterns appear too linear: " + ", ".join(
+                industry for industry, is_linear in zip(test_industries, linear) if is_linear
+            )
 
-    def test_projection_non_linearity(self):
+    def test_projection_non_linearity(self, projector):
         """Test that projections show non-linear patterns"""
-        projector = AIImpactProjector()
-        
         # Create mock current impact data
         current_impact = {
             "date": "2025-05",
@@ -129,65 +165,56 @@ class TestProjectionRealism:
         # Test component evolution
         component_projections = projector.project_component_evolution(current_impact)
         
-        # Verify non-linear evolution for each component
-        for component_name, values in component_projections.items():
-            if len(values) >= 3:
-                # Calculate year-over-year changes
-                changes = [values[i] - values[i-1] for i in range(1, len(values))]
-                
-                # Check that changes aren't all identical (linear)
-                change_variance = np.var(changes)
-                assert change_variance > 0.0001, f"{component_name} shows linear progression"
-                
-                # Verify reasonable bounds
+        # Every component is projected over the same years
+        component_names = list(component_projections)
+        projections = np.asarray([component_projections[name] for name in component_names])
+        
+        # Verify non-linear evolution: year-over-year changes of every component at once
+        if projections.shape[1] >= 3:
+            change_variances = np.var(np.diff(projections, axis=1), axis=1)
+            linear = ~(change_variances > 0.0001)
+            assert not linear.any(), "Linear progression in: " + ", ".join(
+                name for name, is_linear in zip(component_names, linear) if is_linear
+            )
+            
+            # Verify reasonable bounds
+            for component_name, values in component_projections.items():
                 for value in values:
                     if component_name == "market_maturity":
                         assert 0 <= value <= 1.0, f"Market maturity {value} outside bounds"
                     else:
                         assert -1.0 <= value <= 1.0, f"{component_name} value {value} outside reasonable bounds"
 
-    def test_s_curve_properties(self):
+    # Test S-curve for different starting points
+    @pytest.mark.parametrize("start_adoption", [0.1, 0.3, 0.5, 0.7])
+    def test_s_curve_properties(self, projector, start_adoption):
         """Test that S-curve calculations have proper mathematical properties"""
-        projector = AIImpactProjector()
-        
-        # Test S-curve for different starting points
-        starting_adoptions = [0.1, 0.3, 0.5, 0.7]
-        
-        for start_adoption in starting_adoptions:
-            adoptions = projector.calculate_adoption_projection(start_adoption, 5, "Technology")
-            
-            # Verify monotonic increase (S-curve should always increase)
-            for i in range(1, len(adoptions)):
-                assert adoptions[i] >= adoptions[i-1], f"Adoption decreased from year {i-1} to {i}"
+        adoptions = projector.calculate_adoption_projection(start_adoption, 5, "Technology")
+        adoption_array = np.fromiter(adoptions, dtype=np.float64, count=len(adoptions))
+        
+        # Verify monotonic increase (S-curve should always increase)
+        decreases = np.flatnonzero(~(np.diff(adoption_array) >= 0))
+        assert decreases.size == 0, f"Adoption decreased from year {decreases[0]} to {decreases[0] + 1}"
+        
+        # Verify bounded growth (shouldn't exceed ceiling)
+        ceiling = projector.get_sector_param("Technology", "adoption_ceiling", default=0.8)
+        for adoption in adoptions:
+            assert adoption <= ceiling * 1.1, f"Adoption {adoption} exceeded ceiling {ceiling}"
+        
+        # Verify S-curve shape (acceleration should change)
+        if len(adoptions) >= 4:
+            # Second derivative approximation
+            accelerations = np.diff(adoption_array, n=2)
             
-            # Verify bounded growth (shouldn't exceed ceiling)
-            ceiling = projector.get_sector_param("Technology", "adoption_ceiling", default=0.8)
-            for adoption in adoptions:
-                assert adoption <= ceiling * 1.1, f"Adoption {adoption} exceeded ceiling {ceiling}"
-            
-            # Verify S-curve shape (acceleration should change)
-            if len(adoptions) >= 4:
-                accelerations = []
-                for i in range(2, len(adoptions)):
-                    # Second derivative approximation
-                    accel = (adoptions[i] - adoptions[i-1]) - (adoptions[i-1] - adoptions[i-2])
-                    accelerations.append(accel)
-                
-                # S-curve should show varying acceleration
-                accel_range = max(accelerations) - min(accelerations)
-                assert accel_range > 0.001, "S-curve shows constant acceleration (linear behavior)"
+            # S-curve should show varying acceleration
+            assert np.ptp(accelerations) > 0.001, "S-curve shows constant acceleration (linear behavior)"
 
-    def test_data_quality_validation(self):
+    def test_data_quality_validation(self, calculator):
         """Test that data quality indicators are properly calculated"""
-        calculator = AIImpactCalculator()
-        
         # Test with good data
-        good_employment_data = {
-            "industries": {f"Industry_{i}": {"current": 1000000} for i in range(10)}
-        }
         good_job_data = {"test": "data"}
         
-        completeness = calculator.assess_data_completeness(good_employment_data, good_job_data)
+        completeness = calculator.assess_data_completeness(_GOOD_EMPLOYMENT_DATA, good_job_data)
         assert completeness >= 0.7, "Good data should have high completeness score"
         
         # Test with poor data
@@ -198,88 +225,24 @@ class TestProjectionRealism:
         assert poor_completeness <= 0.5, "Poor data should have low completeness score"
         
         # Test with mixed data
-        mixed_completeness = calculator.assess_data_completeness(good_employment_data, None)
+        mixed_completeness = calculator.assess_data_completeness(_GOOD_EMPLOYMENT_DATA, None)
         assert 0.4 <= mixed_completeness <= 0.8, "Mixed data should have medium completeness score"
 
-    def test_realistic_bounds(self):
-        """Test that all calculated values are within realistic bounds"""
-        calculator = AIImpactCalculator()
-        
-        # Create realistic test data
-        test_employment = {
-            "industries": {
-                "Information": {"current": 3000000},
-                "Healthcare": {"current": 20000000},
-                "Manufacturing": {"current": 12000000},
-                "Total Nonfarm": {"current": 150000000}
-            }
-        }
-        
-        result = calculator.calculate_net_impact(test_employment, None)
-        
-        # Check overall impact bounds
-        assert -0.5 <= result["total_impact"] <= 0.3, f"Total impact {result['total_impact']} outside realistic bounds"
-        
-        # Check transformation rate bounds  
-        assert 0 <= result["transformation_rate"] <= 2.0, f"Transformation rate {result['transformation_rate']} outside bounds"
-        
-        # Check industry-specific impacts
-        for industry, data in result["by_industry"].items():
-            impact = data["impact"]
-            assert -0.8 <= impact <= 0.5, f"{industry} impact {impact} outside realistic bounds"
-        
-        # Check component bounds
-        components = result["components"]
-        assert -0.8 <= components["displacement_effect"] <= 0, "Displacement effect outside bounds"
-        assert 0 <= components["creation_effect"] <= 0.5, "Creation effect outside bounds"
-        assert 0 <= components["market_maturity"] <= 1.0, "Market maturity outside bounds"
+    @pytest.mark.parametrize("values, lower, upper", [bounds[1:] for bounds in _NET_IMPACT_BOUNDS],
+                             ids=[bounds[0] for bounds in _NET_IMPACT_BOUNDS])
+    def test_realistic_bounds(self, net_impact, values, lower, upper):
+        """Test that calculated values are within realistic bounds"""
+        values = values(net_impact)
+        
+        # One comparison over every value; name offenders only on failure
+        names = list(values)
+        array = np.fromiter(values.values(), dtype=np.float64, count=len(names))
+        in_bounds = (array >= lower) & (array <= upper)
+        if not in_bounds.all():
+            pytest.fail(f"Outside realistic bounds [{lower}, {upper}]: " + ", ".join(
+                f"{names[i]} {array[i]}" for i in np.flatnonzero(~in_bounds)
+            ))
 
 if __name__ == "__main__":
-    # Run basic tests if executed directly
-    test_suite = TestProjectionRealism()
-    
-    print("Running projection realism tests...")
-    
-    try:
-        test_suite.test_transformation_rate_non_linear()
-        print("✓ Transformation rate test passed")
-    except Exception as e:
-        print(f"✗ Transformation rate test failed: {e}")
-    
-    try:
-        test_suite.test_confidence_intervals_realistic()
-        print("✓ Confidence intervals test passed")
-    except Exception as e:
-        print(f"✗ Confidence intervals test failed: {e}")
-    
-    try:
-        test_suite.test_industry_variation()
-        print("✓ Industry variation test passed")
-    except Exception as e:
-        print(f"✗ Industry variation test failed: {e}")
-    
-    try:
-        test_suite.test_projection_non_linearity()
-        print("✓ Projection non-linearity test passed")
-    except Exception as e:
-        print(f"✗ Projection non-linearity test failed: {e}")
-    
-    try:
-        test_suite.test_s_curve_properties()
-        print("✓ S-curve properties test passed")
-    except Exception as e:
-        print(f"✗ S-curve properties test failed: {e}")
-    
-    try:
-        test_suite.test_data_quality_validation()
-        print("✓ Data quality validation test passed")
-    except Exception as e:
-        print(f"✗ Data quality validation test failed: {e}")
-    
-    try:
-        test_suite.test_realistic_bounds()
-        print("✓ Realistic bounds test passed")
-    except Exception as e:
-        print(f"✗ Realistic bounds test failed: {e}")
-    
-    print("Test suite completed!")
\ No newline at end of file
+    # Run through pytest so the session fixtures and parametrized cases apply
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,71 @@
+import json
+import os
+import sys
+import pytest
+from unittest.mock import Mock, patch
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+# Imported as a module so pytest does not collect its test_* probe functions here
+from validation import validate_apis
+
+
+def _response(payload, status_code=200):
+    """Mock HTTP response carrying payload as its JSON body"""
+    response = Mock(status_code=status_code)
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+@pytest.mark.parametrize("job, expected", [
+    ({"title": "Senior AI Engineer"}, True),
+    ({"title": "AI\u2014Engineer"}, True),
+    ({"title": "ML\u2013Ops Lead"}, True),
+    ({"title": "Backend Developer", "description": "Build machine learning pipelines"}, True),
+    ({"title": "Backend Developer", "description": "Maintain billing services"}, False),
+    ({}, False)
+])
+def test_is_ai_job(job, expected):
+    assert validate_apis._is_ai_job(job) is expected
+
+
+def test_bls_probe_succeeds_on_valid_response():
+    payload = {"status": "REQUEST_SUCCEEDED", "Results": {"series": [{"seriesID": "CEU6054130001"}]}}
+    with patch.object(validate_apis.SESSION, "head", return_value=Mock(status_code=200)), \
+         patch.object(validate_apis.SESSION, "post", return_value=_response(payload)):
+        result = validate_apis.test_bls_api(log=lambda line: None)
+
+    assert result["ok"], result
+    assert result["status"] == 200
+
+
+def test_remote_jobs_probe_succeeds_on_valid_response():
+    payload = {"jobs": [{"title": "Senior AI Engineer"}, {"title": "Backend Developer"}]}
+    lines = []
+    with patch.object(validate_apis.SESSION, "get", return_value=_response(payload)):
+        result = validate_apis.test_remote_jobs_api(log=lines.append)
+
+    assert result["ok"], result
+    assert "Found 1 AI-related jobs" in lines
+
+
+def test_news_probe_succeeds_on_valid_response():
+    with patch.object(validate_apis.SESSION, "get", return_value=_response({"articles": []})):
+        result = validate_apis.test_news_api("key", log=lambda line: None)
+
+    assert result["ok"], result
+
+
+def test_news_probe_skipped_without_key():
+    result = validate_apis.test_news_api(None, log=lambda line: None)
+
+    assert result == {"ok": False, "skipped": True}
+
+
+def test_retry_policy_keeps_preflight_fail_fast():
+    retry = validate_apis._RETRY
+    # Gateway errors on the real requests are retried...
+    assert retry.is_retry("GET", 503) and retry.is_retry("POST", 429)
+    # ...but the HEAD preflight and connection failures are not
+    assert not retry.is_retry("HEAD", 503)
+    assert retry.connect == 0 and retry.read == 0